@@ -61,10 +61,11 @@ def run_chat_completion_example():
         print("\n--- Chat Completion API Error ---")
         print(f"An error occurred: {error}")
         
-        # Additional error handling for requests exceptions
-        if hasattr(error, 'response'):
-            print(f"Status code: {error.response.status_code}")
-            print(f"Response: {error.response.text}")
+        # Additional error handling for HTTP status errors, which carry the API response
+        response = getattr(error, 'response', None)
+        if response is not None:
+            print(f"Status code: {response.status_code}")
+            print(f"Response: {response.text}")
 
     finally:
         print("\n--- End of Chat Completion Example ---")
@@ -10,7 +10,7 @@ To run this example:
 3. Run: python examples/webhook_signature_verification_example.py
 """
 
-import json
+import orjson
 from pearl_sdk import PearlClient
 
 # --- IMPORTANT: Configure your API Key ---
@@ -31,7 +31,9 @@ EXAMPLE_PAYLOAD = {
     }
 }
 
-EXAMPLE_PAYLOAD_JSON_STRING = json.dumps(EXAMPLE_PAYLOAD, separators=(',', ':'))
+# orjson emits compact JSON (no whitespace) by default, matching the body Pearl sends.
+# The SDK signs bytes directly, just like a raw request body, so there is no need to decode it.
+EXAMPLE_PAYLOAD_BYTES = orjson.dumps(EXAMPLE_PAYLOAD)
 
 
 def run_verification_example():
@@ -51,9 +53,9 @@ def run_verification_example():
         # Step 1: Compute the expected signature for the example payload.
         # In a real scenario, Pearl's API would have computed this signature and sent it
         # in the 'X-Pearl-API-Signature' header of an incoming webhook.
-        expected_signature = client.webhooks.compute_signature(EXAMPLE_PAYLOAD_JSON_STRING)
+        expected_signature = client.webhooks.compute_signature(EXAMPLE_PAYLOAD_BYTES)
 
-        print("Example Webhook Payload:", EXAMPLE_PAYLOAD_JSON_STRING)
+        print("Example Webhook Payload:", EXAMPLE_PAYLOAD_BYTES.decode('utf-8'))
         print("API Key (used as base for secret):", API_KEY)
         print("Computed Expected Signature:", expected_signature)
 
@@ -61,7 +63,7 @@ def run_verification_example():
         # We use the `expected_signature` as the `received_signature` to simulate a valid webhook.
         is_valid = client.webhooks.is_valid_signature(
             expected_signature,
-            EXAMPLE_PAYLOAD_JSON_STRING
+            EXAMPLE_PAYLOAD_BYTES
         )
 
         if is_valid:
@@ -74,7 +76,7 @@ def run_verification_example():
         intentionally_invalid_signature = 'invalid-signature-definitely-wrong-base64='
         is_invalid = client.webhooks.is_valid_signature(
             intentionally_invalid_signature,
-            EXAMPLE_PAYLOAD_JSON_STRING
+            EXAMPLE_PAYLOAD_BYTES
         )
 
         if not is_invalid:
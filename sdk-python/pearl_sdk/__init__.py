@@ -6,6 +6,7 @@ to AI chat completions, webhook management, and secure signature verification ut
 """
 
 from .client import PearlClient
+from .async_client import AsyncPearlClient
 from .types import (
     # Configuration types
     RetryPolicyConfig,
@@ -44,6 +45,7 @@ __email__ = "support@pearl.com"
 
 __all__ = [
     'PearlClient',
+    'AsyncPearlClient',
     'RetryPolicyConfig',
     'ConversationModes',
     'DEFAULT_MODEL',
@@ -0,0 +1,180 @@
+"""
+Asynchronous client for interacting with the Pearl API.
+"""
+
+import asyncio
+import time
+from typing import Optional
+import httpx
+
+from .types import RetryPolicyConfig
+from .client import _environment_proxy_urls, _pool_options
+from .core.retry_policy import RetryPolicy
+from .resources.chat import AsyncChat
+from .resources.webhooks import AsyncWebhooks
+
+
+class AsyncPearlClient:
+    """
+    Asynchronous client for interacting with the Pearl API.
+
+    Mirrors `PearlClient`, but its request methods are coroutines so that many requests
+    can be in flight at once, for example with `asyncio.gather`.
+    """
+
+    # Resources are created on first access, see __getattr__
+    chat: AsyncChat
+    webhooks: AsyncWebhooks
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: Optional[str] = None,
+        timeout: Optional[int] = None,
+        retry_policy: Optional[RetryPolicyConfig] = None
+    ):
+        """
+        Initializes a new instance of the AsyncPearlClient.
+
+        Args:
+            api_key: Your Pearl API key.
+            base_url: Base URL for the Pearl API (optional, defaults to https://api.pearl.com/api/v1).
+            timeout: Request timeout in seconds (optional, defaults to 30).
+            retry_policy: Retry policy configuration (optional).
+
+        Raises:
+            ValueError: If `api_key` is missing or `timeout` is invalid.
+        """
+        if not api_key:
+            raise ValueError("AsyncPearlClient must include an api_key.")
+
+        if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+            raise ValueError("Timeout must be a positive number if provided.")
+
+        self._api_key = api_key
+        self._base_url = base_url or 'https://api.pearl.com/api/v1'
+        self._retry_policy = RetryPolicy(retry_policy)
+
+        # Set timeout
+        timeout = timeout if timeout is not None else 30
+
+        # Configure a pooled HTTP/2 transport wrapped with custom retry logic.
+        # Transport-level retries are disabled so that only the Pearl retry policy applies.
+        retry_transport = AsyncRetryTransport(
+            transport=httpx.AsyncHTTPTransport(**_pool_options(None)),
+            retry_policy=self._retry_policy,
+            timeout=timeout
+        )
+        # Honour proxies from the environment, which httpx skips when given a transport
+        proxy_mounts = {
+            pattern: None if proxy_url is None else AsyncRetryTransport(
+                transport=httpx.AsyncHTTPTransport(**_pool_options(proxy_url)),
+                retry_policy=self._retry_policy,
+                timeout=timeout
+            )
+            for pattern, proxy_url in _environment_proxy_urls().items()
+        }
+
+        # Configure the HTTP session; relative URLs are resolved against the base URL
+        self._session = httpx.AsyncClient(
+            base_url=self._base_url,
+            timeout=timeout,
+            headers={
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {self._api_key}',
+            },
+            transport=retry_transport,
+            mounts=proxy_mounts
+        )
+
+    def __getattr__(self, name: str):
+        """
+        Lazily creates the `chat` and `webhooks` resources on first access.
+
+        Callers that only use one resource never pay for the other, and the webhook HMAC
+        key is only derived when webhooks are used. The created resource is stored as an
+        instance attribute, so later accesses no longer reach this method.
+        """
+        if name == 'chat':
+            self.chat = AsyncChat(self._session)
+            return self.chat
+        if name == 'webhooks':
+            self.webhooks = AsyncWebhooks(self._session, self._api_key)
+            return self.webhooks
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def base_url(self) -> str:
+        """Public getter to access the base URL that request paths are resolved against."""
+        return self._base_url
+
+    async def aclose(self) -> None:
+        """Closes the underlying HTTP session and releases its pooled connections."""
+        await self._session.aclose()
+
+    async def __aenter__(self) -> 'AsyncPearlClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class AsyncRetryTransport(httpx.AsyncBaseTransport):
+    """Custom asynchronous HTTP transport that implements Pearl SDK retry logic."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, retry_policy: RetryPolicy, timeout: float):
+        """
+        Initialize the retry transport.
+
+        Args:
+            transport: The underlying transport used to send requests.
+            retry_policy: The retry policy to use.
+            timeout: Default timeout for requests, used to bound the total time spent retrying.
+        """
+        self.transport = transport
+        self.retry_policy = retry_policy
+        self.timeout = timeout
+        # Snapshot the retry decision inputs so the request loop avoids a method call per attempt
+        self._retryable_status_codes = retry_policy.retryable_status_codes
+        self._max_retries = retry_policy.max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """
+        Send a request with custom retry logic, yielding to the event loop between attempts.
+
+        Network errors raised by the underlying transport carry no status code and
+        are therefore never retried; they propagate to the caller unchanged.
+
+        The whole exchange is bounded by a deadline of one timeout per allowed attempt.
+        Backoff sleeps are clamped to the remaining budget, and once it is spent the last
+        response is returned as-is instead of being retried.
+
+        Args:
+            request: The request to send.
+
+        Returns:
+            The response.
+        """
+        retryable_status_codes = self._retryable_status_codes
+        max_retries = self._max_retries
+        deadline = time.monotonic() + self.timeout * (max_retries + 1)
+        retry_count = 0
+
+        while True:
+            response = await self.transport.handle_async_request(request)
+
+            # Check if we should retry based on status code
+            if response.status_code in retryable_status_codes and retry_count < max_retries:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    await response.aclose()
+                    retry_count += 1
+                    delay_ms = self.retry_policy.calculate_retry_delay(retry_count)
+                    await asyncio.sleep(min(delay_ms / 1000.0, remaining))
+                    continue
+
+            return response
+
+    async def aclose(self) -> None:
+        """Close the underlying transport."""
+        await self.transport.aclose()
@@ -2,11 +2,15 @@
 Main client for interacting with the Pearl API.
 """
 
+import atexit
+import os
+import socket
+import threading
 import time
-from typing import Optional, Dict, Any
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+from typing import Any, Dict, Optional
+import httpx
+# Reused so that proxy variables are interpreted exactly as by a plain httpx.Client
+from httpx._utils import get_environment_proxies
 
 from .types import RetryPolicyConfig
 from .core.retry_policy import RetryPolicy
@@ -14,11 +18,120 @@ from .resources.chat import Chat
 from .resources.webhooks import Webhooks
 
 
+# Connection pool limits shared by the synchronous and asynchronous clients.
+# Idle connections are kept for longer than the httpx default so bursts of requests reuse them.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=50, max_connections=100, keepalive_expiry=30)
+
+# Enable TCP keep-alive probes so long-lived pooled sockets are not silently dropped by NATs.
+# The probe tuning options are not available on every platform.
+# Transports only accept `socket_options` from httpx 0.25.0, the declared minimum version.
+_SOCKET_OPTIONS = [(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)] + [
+    (socket.IPPROTO_TCP, option, value)
+    for option, value in (
+        (getattr(socket, 'TCP_KEEPIDLE', None), 60),
+        (getattr(socket, 'TCP_KEEPINTVL', None), 30),
+        (getattr(socket, 'TCP_KEEPCNT', None), 3),
+    )
+    if option is not None
+]
+
+
+def _pool_options(proxy_url: Optional[str]) -> Dict[str, Any]:
+    """
+    Returns the keyword arguments for a pooled transport, optionally routed through a proxy.
+
+    Transport-level retries are disabled so that only the Pearl retry policy applies.
+    """
+    return {
+        'http2': True,
+        'limits': _POOL_LIMITS,
+        'retries': 0,
+        'socket_options': _SOCKET_OPTIONS,
+        'proxy': httpx.Proxy(proxy_url) if proxy_url is not None else None,
+    }
+
+
+def _environment_proxy_urls() -> Dict[str, Optional[str]]:
+    """
+    Returns the proxies configured through HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and NO_PROXY.
+
+    httpx ignores these variables once a client is given a custom transport, so the clients
+    mount their own proxied retry transports instead. The mapping is the one httpx itself
+    builds for a plain client: URL patterns to proxy URLs, with `None` for hosts that bypass
+    the proxy and are therefore served by the client's default transport.
+    """
+    return get_environment_proxies()
+
+
+# Process-wide connection pools shared by every PearlClient: one for direct connections and
+# one per proxy URL. Clients only differ in their headers, base URL, timeout and retry policy,
+# none of which live in the pool, so sharing them lets short-lived clients (e.g., one per web
+# request) reuse open TCP/TLS connections.
+_default_pool: Optional[httpx.HTTPTransport] = None
+_proxy_pools: Dict[str, httpx.HTTPTransport] = {}
+_default_pool_lock = threading.Lock()
+
+
+def _get_default_pool(proxy_url: Optional[str] = None) -> httpx.HTTPTransport:
+    """Returns the shared connection pool for direct or proxied connections, creating it on first use."""
+    global _default_pool
+    pool = _default_pool if proxy_url is None else _proxy_pools.get(proxy_url)
+    if pool is not None:
+        return pool
+
+    with _default_pool_lock:
+        if proxy_url is not None:
+            if proxy_url not in _proxy_pools:
+                _proxy_pools[proxy_url] = httpx.HTTPTransport(**_pool_options(proxy_url))
+            return _proxy_pools[proxy_url]
+        if _default_pool is None:
+            _default_pool = httpx.HTTPTransport(**_pool_options(None))
+        return _default_pool
+
+
+def _close_default_pool() -> None:
+    """Closes the shared connection pools, if they were created."""
+    global _default_pool
+    with _default_pool_lock:
+        if _default_pool is not None:
+            _default_pool.close()
+            _default_pool = None
+        for pool in _proxy_pools.values():
+            pool.close()
+        _proxy_pools.clear()
+
+
+def _reset_default_pool_after_fork() -> None:
+    """
+    Forgets the shared connection pools in a forked child process.
+
+    The child inherits the parent's open sockets, and sharing HTTP/2 connections across
+    processes interleaves their frames. The inherited pools are dropped without being closed,
+    since closing them would shut down connections the parent is still using. The lock is
+    recreated too, in case another thread held it at the time of the fork.
+    """
+    global _default_pool, _proxy_pools, _default_pool_lock
+    _default_pool = None
+    _proxy_pools = {}
+    _default_pool_lock = threading.Lock()
+
+
+atexit.register(_close_default_pool)
+
+# os.register_at_fork is not available on platforms without fork (e.g., Windows)
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_default_pool_after_fork)
+
+
 class PearlClient:
     """Main client for interacting with the Pearl API."""
 
+    # Resources are created on first access, see __getattr__
+    chat: Chat
+    webhooks: Webhooks
+
     def __init__(
-        self, 
+        self,
         api_key: str,
         base_url: Optional[str] = None,
         timeout: Optional[int] = None,
@@ -26,117 +139,162 @@ class PearlClient:
     ):
         """
         Initializes a new instance of the PearlClient.
-        
+
         Args:
             api_key: Your Pearl API key.
             base_url: Base URL for the Pearl API (optional, defaults to https://api.pearl.com/api/v1).
             timeout: Request timeout in seconds (optional, defaults to 30).
             retry_policy: Retry policy configuration (optional).
-            
+
         Raises:
             ValueError: If `api_key` is missing or `timeout` is invalid.
         """
         if not api_key:
             raise ValueError("PearlClient must include an api_key.")
-        
+
         if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
             raise ValueError("Timeout must be a positive number if provided.")
 
         self._api_key = api_key
         self._base_url = base_url or 'https://api.pearl.com/api/v1'
         self._retry_policy = RetryPolicy(retry_policy)
-        
-        # Configure the requests session
-        self._session = requests.Session()
-        self._session.headers.update({
-            'Content-Type': 'application/json',
-            'Authorization': f'Bearer {self._api_key}',
-        })
-        
+
         # Set timeout
         timeout = timeout if timeout is not None else 30
-        
-        # Configure retry adapter with custom retry logic
-        retry_adapter = RetryHTTPAdapter(
+
+        # Wrap the shared HTTP/2 connection pools with custom retry logic.
+        # The pools outlive this client, so closing the client must not close them.
+        retry_transport = RetryTransport(
+            transport=_get_default_pool(),
             retry_policy=self._retry_policy,
-            timeout=timeout
+            timeout=timeout,
+            owns_transport=False
         )
-        
-        self._session.mount('http://', retry_adapter)
-        self._session.mount('https://', retry_adapter)
-        
-        # Set base URL for all requests
-        self._session.request = self._create_request_wrapper(self._session.request)
-
-        # Initialize resources
-        self.chat = Chat(self._session)
-        self.webhooks = Webhooks(self._session, self._api_key)
-
-    def _create_request_wrapper(self, original_request):
-        """Create a wrapper for the session request method to handle base URL."""
-        def request_wrapper(method, url, **kwargs):
-            # Prepend base URL if url doesn't start with http
-            if not url.startswith('http'):
-                url = self._base_url.rstrip('/') + '/' + url.lstrip('/')
-            return original_request(method, url, **kwargs)
-        return request_wrapper
-
-
-class RetryHTTPAdapter(HTTPAdapter):
-    """Custom HTTP adapter that implements Pearl SDK retry logic."""
-    
-    def __init__(self, retry_policy: RetryPolicy, timeout: float, *args, **kwargs):
+        # Honour proxies from the environment, which httpx skips when given a transport
+        proxy_mounts = {
+            pattern: None if proxy_url is None else RetryTransport(
+                transport=_get_default_pool(proxy_url),
+                retry_policy=self._retry_policy,
+                timeout=timeout,
+                owns_transport=False
+            )
+            for pattern, proxy_url in _environment_proxy_urls().items()
+        }
+
+        # Configure the HTTP session; relative URLs are resolved against the base URL
+        self._session = httpx.Client(
+            base_url=self._base_url,
+            timeout=timeout,
+            headers={
+                'Content-Type': 'application/json',
+                'Authorization': f'Bearer {self._api_key}',
+            },
+            transport=retry_transport,
+            mounts=proxy_mounts
+        )
+
+    def __getattr__(self, name: str):
+        """
+        Lazily creates the `chat` and `webhooks` resources on first access.
+
+        Callers that only use one resource never pay for the other, and the webhook HMAC
+        key is only derived when webhooks are used. The created resource is stored as an
+        instance attribute, so later accesses no longer reach this method.
+        """
+        if name == 'chat':
+            self.chat = Chat(self._session)
+            return self.chat
+        if name == 'webhooks':
+            self.webhooks = Webhooks(self._session, self._api_key)
+            return self.webhooks
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+    @property
+    def base_url(self) -> str:
+        """Public getter to access the base URL that request paths are resolved against."""
+        return self._base_url
+
+    def close(self) -> None:
+        """
+        Closes this client's HTTP session.
+
+        The connection pool shared by all PearlClient instances is left open for other
+        clients; it is closed automatically when the interpreter exits.
+        """
+        self._session.close()
+
+    def __enter__(self) -> 'PearlClient':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class RetryTransport(httpx.BaseTransport):
+    """Custom HTTP transport that implements Pearl SDK retry logic."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        retry_policy: RetryPolicy,
+        timeout: float,
+        owns_transport: bool = True
+    ):
         """
-        Initialize the retry adapter.
-        
+        Initialize the retry transport.
+
         Args:
+            transport: The underlying transport used to send requests.
             retry_policy: The retry policy to use.
-            timeout: Default timeout for requests.
+            timeout: Default timeout for requests, used to bound the total time spent retrying.
+            owns_transport: Whether closing this transport also closes the underlying one.
         """
+        self.transport = transport
         self.retry_policy = retry_policy
         self.timeout = timeout
-        super().__init__(*args, **kwargs)
-    
-    def send(self, request, **kwargs):
+        # Snapshot the retry decision inputs so the request loop avoids a method call per attempt
+        self._retryable_status_codes = retry_policy.retryable_status_codes
+        self._max_retries = retry_policy.max_retries
+        self.owns_transport = owns_transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
         """
         Send a request with custom retry logic.
-        
+
+        Network errors raised by the underlying transport carry no status code and
+        are therefore never retried; they propagate to the caller unchanged.
+
+        The whole exchange is bounded by a deadline of one timeout per allowed attempt.
+        Backoff sleeps are clamped to the remaining budget, and once it is spent the last
+        response is returned as-is instead of being retried.
+
         Args:
             request: The request to send.
-            **kwargs: Additional keyword arguments.
-            
+
         Returns:
             The response.
         """
-        # Set timeout if not provided
-        if 'timeout' not in kwargs:
-            kwargs['timeout'] = self.timeout
-        
+        retryable_status_codes = self._retryable_status_codes
+        max_retries = self._max_retries
+        deadline = time.monotonic() + self.timeout * (max_retries + 1)
         retry_count = 0
-        
-        while True:
-            response = None
-            status_code = None
-            exception_to_raise = None
-
-            try:
-                response = super().send(request, **kwargs)
-                status_code = response.status_code
 
-            except requests.RequestException as e:
-                # Extract status code if available
-                if hasattr(e, 'response') and e.response is not None:
-                    status_code = e.response.status_code
-                exception_to_raise = e
+        while True:
+            response = self.transport.handle_request(request)
 
             # Check if we should retry based on status code
-            if self.retry_policy.should_retry(retry_count, status_code):
-                retry_count += 1
-                delay_ms = self.retry_policy.calculate_retry_delay(retry_count)
-                time.sleep(delay_ms / 1000.0)
-                continue
-
-            if exception_to_raise:
-                raise exception_to_raise
+            if response.status_code in retryable_status_codes and retry_count < max_retries:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    response.close()
+                    retry_count += 1
+                    delay_ms = self.retry_policy.calculate_retry_delay(retry_count)
+                    time.sleep(min(delay_ms / 1000.0, remaining))
+                    continue
 
             return response
+
+    def close(self) -> None:
+        """Close the underlying transport, unless it is shared with other clients."""
+        if self.owns_transport:
+            self.transport.close()
@@ -2,9 +2,8 @@
 Encapsulates the retry logic for API requests, including exponential backoff with jitter.
 """
 
-import math
 import random
-from typing import Optional
+from typing import FrozenSet, Optional
 from pearl_sdk.types import RetryPolicyConfig
 
 
@@ -42,11 +41,23 @@ class RetryPolicy:
         if self.retry_delay_ms > self.max_retry_delay_ms:
             raise ValueError("RetryPolicy: retry_delay_ms cannot be greater than max_retry_delay_ms.")
 
+        # Status codes eligible for retry, resolved once so should_retry is a single set lookup.
+        # Note: Current implementation only retries 422; a disabled policy retries nothing.
+        self._retryable_status_codes = frozenset({422}) if self.enabled else frozenset()
+
+        # Per-policy generator for jitter, so concurrent clients do not share the module-level one
+        self._rng = random.Random()
+
     @property
     def max_retries(self) -> int:
         """Public getter to access the maximum number of retries."""
         return self._max_retries
 
+    @property
+    def retryable_status_codes(self) -> FrozenSet[int]:
+        """Public getter to access the status codes that are retried while under max_retries."""
+        return self._retryable_status_codes
+
     def should_retry(self, current_retry_count: int, status_code: Optional[int] = None) -> bool:
         """
         Determines if a request should be retried based on its current retry count and policy settings.
@@ -58,12 +69,7 @@ class RetryPolicy:
         Returns:
             True if the request should be retried, false otherwise.
         """
-        if not self.enabled:
-            return False
-
-        # Note: Current implementation only retries 422.
-        is_retryable_status = status_code == 422
-        return is_retryable_status and current_retry_count < self._max_retries
+        return status_code in self._retryable_status_codes and current_retry_count < self._max_retries
 
     def calculate_retry_delay(self, retry_count: int) -> int:
         """
@@ -78,7 +84,14 @@ class RetryPolicy:
         Returns:
             The calculated delay in milliseconds.
         """
-        exponential_delay = self.retry_delay_ms * math.pow(2, retry_count - 1)
-        capped_delay = min(exponential_delay, self.max_retry_delay_ms)
-        jitter = random.random() * capped_delay * 0.1  # Add up to 10% jitter
-        return math.floor(capped_delay + jitter)
+        shift = max(retry_count - 1, 0)
+
+        # Once the shift reaches the bit length of the cap, the exponential delay is
+        # guaranteed to exceed it, so skip building an arbitrarily large integer.
+        if shift >= self.max_retry_delay_ms.bit_length():
+            capped_delay = self.max_retry_delay_ms
+        else:
+            capped_delay = min(self.retry_delay_ms << shift, self.max_retry_delay_ms)
+
+        jitter = (self._rng.getrandbits(16) * capped_delay) // (10 * 65536)  # Add up to 10% jitter
+        return capped_delay + jitter
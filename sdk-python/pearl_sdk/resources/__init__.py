@@ -1,6 +1,6 @@
 """Pearl SDK for Python - Resources module."""
 
-from .chat import Chat
-from .webhooks import Webhooks
+from .chat import Chat, AsyncChat
+from .webhooks import Webhooks, AsyncWebhooks
 
-__all__ = ['Chat', 'Webhooks']
+__all__ = ['Chat', 'AsyncChat', 'Webhooks', 'AsyncWebhooks']
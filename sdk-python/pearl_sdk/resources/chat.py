@@ -2,20 +2,52 @@
 Manages chat-related operations, structured under `client.chat`.
 """
 
+import functools
 from typing import Optional, Dict, Any, List
-import requests
-from pearl_sdk.types import ChatMessage, ChatCompletionResponse, ConversationModes, DEFAULT_MODEL
+import httpx
+import orjson
+from pearl_sdk.types import (
+    ChatMessage, ChatCompletionResponse, ChatCompletionChoice, ChatCompletionResponseMessage,
+    ExpertInfo, ConversationModes, DEFAULT_MODEL
+)
+
+
+# Shared read-only stand-in for a missing `message` object, to avoid allocating a dict per choice
+_EMPTY_MAPPING: Dict[str, Any] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _request_envelope(model: str, mode: str, session_id: str) -> bytes:
+    """
+    Serialize the part of a chat completion request body that precedes the messages.
+    
+    Agent-style callers send many completions per session with the same model, mode and
+    session ID, so the envelope is cached and only the messages are serialized per call.
+    
+    Args:
+        model: The model to use.
+        mode: The conversation mode.
+        session_id: Unique identifier for the chat session.
+        
+    Returns:
+        The opening of the JSON body, up to and including the `"messages":` key.
+    """
+    return (
+        b'{"model":' + orjson.dumps(model)
+        + b',"metadata":' + orjson.dumps({"mode": mode, "sessionId": session_id})
+        + b',"messages":'
+    )
 
 
 class Chat:
     """Manages chat-related operations, structured under `client.chat`."""
 
-    def __init__(self, session: requests.Session):
+    def __init__(self, session: httpx.Client):
         """
         Initialize the Chat resource.
         
         Args:
-            session: The requests session configured for Pearl API communication.
+            session: The HTTP session configured for Pearl API communication.
         """
         self._session = session
 
@@ -44,30 +76,43 @@ class Chat:
             The ChatCompletionResponse on success.
             
         Raises:
-            requests.RequestException: If the API call fails or a network issue occurs.
+            httpx.HTTPError: If the API call fails or a network issue occurs.
         """
-        # Construct the request object internally
-        request_data = {
-            "model": model,
-            "messages": [
-                {"role": msg.role, "content": msg.content}
-                for msg in messages
-            ],
-            "metadata": {"mode": mode, "sessionId": session_id}
-        }
-        
-        # Merge any additional request configuration
-        kwargs = {}
-        if request_config:
-            kwargs.update(request_config)
+        # Construct the request body internally
+        request_body = self._build_request_body(messages, session_id, mode, model)
         
-        response = self._session.post('/chat/completions', json=request_data, **kwargs)
+        # The body is serialized with orjson; the session supplies the JSON Content-Type header
+        response = self._session.post('/chat/completions', content=request_body, **(request_config or {}))
         response.raise_for_status()
         
         # Convert response to ChatCompletionResponse
-        data = response.json()
+        data = orjson.loads(response.content)
         return self._parse_chat_completion_response(data)
 
+    def _build_request_body(
+        self,
+        messages: List[ChatMessage],
+        session_id: str,
+        mode: str,
+        model: str
+    ) -> bytes:
+        """
+        Build the serialized JSON request body for a chat completion request.
+        
+        The cached envelope is spliced together with the serialized messages. The messages
+        are passed to orjson as-is, since it serializes `ChatMessage` dataclasses natively.
+        
+        Args:
+            messages: Array of chat messages for the conversation.
+            session_id: Unique identifier for the chat session.
+            mode: The conversation mode.
+            model: The model to use.
+            
+        Returns:
+            The request body as JSON bytes.
+        """
+        return _request_envelope(model, mode, session_id) + orjson.dumps(messages) + b'}'
+
     def _parse_chat_completion_response(self, data: Dict[str, Any]) -> ChatCompletionResponse:
         """
         Parse the API response into a ChatCompletionResponse object.
@@ -78,38 +123,36 @@ class Chat:
         Returns:
             A ChatCompletionResponse object.
         """
-        from pearl_sdk.types import (
-            ChatCompletionResponse, ChatCompletionChoice, ChatCompletionResponseMessage,
-            ExpertInfo
-        )
-        
+        # Bind the model factories to locals for the per-choice loop
+        _ExpertInfo = ExpertInfo
+        _ResponseMessage = ChatCompletionResponseMessage
+        _Choice = ChatCompletionChoice
+
         # Parse choices
         choices = []
-        for choice_data in data.get('choices', []):
-            message_data = choice_data.get('message', {})
+        append_choice = choices.append
+        for choice_data in data.get('choices') or ():
+            message_data = choice_data.get('message') or _EMPTY_MAPPING
             expert_info_data = message_data.get('expertInfo') or message_data.get('expert_info')
             
             expert_info = None
             if expert_info_data:
-                expert_info = ExpertInfo(
+                expert_info = _ExpertInfo(
                     name=expert_info_data.get('name'),
                     job_description=expert_info_data.get('jobDescription') or expert_info_data.get('job_description'),
                     avatar_url=expert_info_data.get('avatarUrl') or expert_info_data.get('avatar_url')
                 )
             
-            message = ChatCompletionResponseMessage(
-                is_human=message_data.get('isHuman', False) or message_data.get('is_human', False),
-                expert_info=expert_info,
-                role=message_data.get('role', 'assistant'),
-                content=message_data.get('content')
-            )
-            
-            choice = ChatCompletionChoice(
+            append_choice(_Choice(
                 index=choice_data.get('index', 0),
-                message=message,
+                message=_ResponseMessage(
+                    is_human=message_data.get('isHuman', False) or message_data.get('is_human', False),
+                    expert_info=expert_info,
+                    role=message_data.get('role', 'assistant'),
+                    content=message_data.get('content')
+                ),
                 finish_reason=choice_data.get('finish_reason', '')
-            )
-            choices.append(choice)
+            ))
         
         return ChatCompletionResponse(
             id=data.get('id', ''),
@@ -118,3 +161,51 @@ class Chat:
             question_id=data.get('questionId') or data.get('question_id'),
             user_id=data.get('userId') or data.get('user_id')
         )
+
+
+class AsyncChat(Chat):
+    """Manages chat-related operations for the asynchronous client, structured under `client.chat`."""
+
+    def __init__(self, session: httpx.AsyncClient):
+        """
+        Initialize the AsyncChat resource.
+        
+        Args:
+            session: The asynchronous HTTP session configured for Pearl API communication.
+        """
+        self._session = session
+
+    async def send_completion(
+        self,
+        messages: List[ChatMessage],
+        session_id: str,
+        mode: str = ConversationModes.PEARL_AI,
+        model: str = DEFAULT_MODEL,
+        request_config: Optional[Dict[str, Any]] = None
+    ) -> ChatCompletionResponse:
+        """
+        Sends a chat completion request to the Pearl API's /chat/completions endpoint.
+        
+        Awaiting several calls concurrently (e.g., with `asyncio.gather`) overlaps their
+        network latency instead of paying it once per request.
+        
+        Args:
+            messages: Array of chat messages for the conversation.
+            session_id: Unique identifier for the chat session.
+            mode: The conversation mode (optional, defaults to PEARL_AI).
+            model: The model to use (optional, defaults to "pearl-ai").
+            request_config: Optional request configuration (e.g., custom headers, timeout override).
+            
+        Returns:
+            The ChatCompletionResponse on success.
+            
+        Raises:
+            httpx.HTTPError: If the API call fails or a network issue occurs.
+        """
+        request_body = self._build_request_body(messages, session_id, mode, model)
+        
+        response = await self._session.post('/chat/completions', content=request_body, **(request_config or {}))
+        response.raise_for_status()
+        
+        data = orjson.loads(response.content)
+        return self._parse_chat_completion_response(data)
@@ -3,9 +3,14 @@ Provides utilities for handling Pearl webhooks, including signature verification
 and managing webhook endpoints (register/update).
 """
 
-from typing import Optional, Dict, Any
-import requests
-from pearl_sdk.utils.signature_utils import verify_webhook_signature, compute_webhook_signature
+from typing import Optional, Dict, Any, Iterable, Iterator, Tuple, Union
+import httpx
+from pearl_sdk.utils.signature_utils import (
+    RawPayload,
+    compute_webhook_signature_with_key,
+    derive_webhook_hmac_key,
+    verify_webhook_signature_with_key,
+)
 from pearl_sdk.types import WebhookEndpointRequest
 
 
@@ -15,12 +20,12 @@ class Webhooks:
     and managing webhook endpoints (register/update).
     """
 
-    def __init__(self, session: requests.Session, webhook_secret: str):
+    def __init__(self, session: httpx.Client, webhook_secret: str):
         """
         Initializes a new instance of the Webhooks resource.
         
         Args:
-            session: The requests session configured for Pearl API communication.
+            session: The HTTP session configured for Pearl API communication.
             webhook_secret: The secret used to sign and verify webhooks.
             
         Raises:
@@ -31,11 +36,14 @@ class Webhooks:
         
         self._session = session
         self._webhook_secret = webhook_secret
+        # The HMAC key only depends on the secret, so derive it once rather than per signature.
+        # The signature helpers keep a keyed HMAC state per key, so it is not re-applied either.
+        self._hmac_key = derive_webhook_hmac_key(webhook_secret)
 
     def is_valid_signature(
         self,
-        received_signature: str,
-        webhook_payload_json_string: str
+        received_signature: Union[str, bytes],
+        webhook_payload_json_string: RawPayload
     ) -> bool:
         """
         Verifies the authenticity of a Pearl webhook payload using its signature.
@@ -44,19 +52,47 @@ class Webhooks:
         It ensures the webhook originated from your Pearl API and has not been tampered with.
         
         Args:
-            received_signature: The signature received in the 'X-Pearl-API-Signature' header.
-            webhook_payload_json_string: The raw, unparsed JSON string of the webhook request body.
+            received_signature: The signature received in the 'X-Pearl-API-Signature' header, as a string or bytes.
+            webhook_payload_json_string: The raw, unparsed webhook request body. Pass the request bytes
+                directly (e.g., `request.get_data()`) to avoid decoding and re-encoding them.
             
         Returns:
             `True` if the signature is valid, indicating an authentic and untampered webhook; `False` otherwise.
+            
+        Raises:
+            ValueError: If required parameters are missing.
         """
-        return verify_webhook_signature(
-            received_signature,
-            webhook_payload_json_string,
-            self._webhook_secret
-        )
+        return verify_webhook_signature_with_key(received_signature, webhook_payload_json_string, self._hmac_key)
+
+    def verify_many(
+        self,
+        items: Iterable[Tuple[str, RawPayload]]
+    ) -> Iterator[Tuple[str, RawPayload, bool]]:
+        """
+        Verifies a batch of webhook signatures with this resource's webhook secret.
+        
+        Intended for consumers that drain many webhooks at once, e.g. from a queue. Every item
+        is signed from the same keyed HMAC state, so the key is neither re-derived nor re-applied
+        per message. Results are produced lazily, in input order.
+        
+        Unlike `is_valid_signature`, an item with a missing signature or payload does not raise;
+        it is reported as invalid, so that one malformed message does not abort the whole batch.
+        
+        Args:
+            items: `(received_signature, payload)` pairs, where each payload is the raw webhook
+                request body as a string or bytes.
+            
+        Yields:
+            `(received_signature, payload, is_valid)` for every item.
+        """
+        hmac_key = self._hmac_key
+        verify = verify_webhook_signature_with_key
+        
+        for received_signature, payload in items:
+            is_valid = bool(received_signature and payload) and verify(received_signature, payload, hmac_key)
+            yield received_signature, payload, is_valid
 
-    def compute_signature(self, payload: str) -> str:
+    def compute_signature(self, payload: RawPayload) -> str:
         """
         Utility to compute a signature for a given payload.
         
@@ -66,12 +102,12 @@ class Webhooks:
         The webhook secret is derived from the PearlClient's API key.
         
         Args:
-            payload: The raw JSON string of the body to be signed.
+            payload: The raw JSON body to be signed, as a string or bytes.
             
         Returns:
             The Base64-encoded HMAC-SHA1 signature.
         """
-        return compute_webhook_signature(self._webhook_secret, payload)
+        return compute_webhook_signature_with_key(self._hmac_key, payload)
 
     def register(
         self,
@@ -87,15 +123,13 @@ class Webhooks:
             request_config: Optional request configuration (e.g., custom headers, timeout override).
             
         Raises:
-            requests.RequestException: On API errors (e.g., 400, 401, 500).
+            httpx.HTTPError: On API errors (e.g., 400, 401, 500).
         """
-        request_data = {"endpoint": request.endpoint}
-        
-        kwargs = {}
-        if request_config:
-            kwargs.update(request_config)
-        
-        response = self._session.post('/webhook', json=request_data, **kwargs)
+        response = self._session.post(
+            '/webhook',
+            json={"endpoint": request.endpoint},
+            **(request_config or {})
+        )
         response.raise_for_status()
 
     def update(
@@ -112,13 +146,64 @@ class Webhooks:
             request_config: Optional request configuration (e.g., custom headers, timeout override).
             
         Raises:
-            requests.RequestException: On API errors (e.g., 400, 401, 500).
+            httpx.HTTPError: On API errors (e.g., 400, 401, 500).
         """
-        request_data = {"endpoint": request.endpoint}
+        response = self._session.put(
+            '/webhook',
+            json={"endpoint": request.endpoint},
+            **(request_config or {})
+        )
+        response.raise_for_status()
+
+
+class AsyncWebhooks(Webhooks):
+    """
+    Provides utilities for handling Pearl webhooks for the asynchronous client.
+    Signature verification is CPU-bound and stays synchronous; endpoint management is awaitable.
+    """
+
+    async def register(
+        self,
+        request: WebhookEndpointRequest,
+        request_config: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Registers a new webhook endpoint for message notifications.
+        Corresponds to the POST /webhook API endpoint.
         
-        kwargs = {}
-        if request_config:
-            kwargs.update(request_config)
+        Args:
+            request: The WebhookEndpointRequest containing the webhook endpoint URL.
+            request_config: Optional request configuration (e.g., custom headers, timeout override).
+            
+        Raises:
+            httpx.HTTPError: On API errors (e.g., 400, 401, 500).
+        """
+        response = await self._session.post(
+            '/webhook',
+            json={"endpoint": request.endpoint},
+            **(request_config or {})
+        )
+        response.raise_for_status()
+
+    async def update(
+        self,
+        request: WebhookEndpointRequest,
+        request_config: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Updates an existing webhook endpoint.
+        Corresponds to the PUT /webhook API endpoint.
         
-        response = self._session.put('/webhook', json=request_data, **kwargs)
+        Args:
+            request: The WebhookEndpointRequest containing the updated webhook endpoint URL.
+            request_config: Optional request configuration (e.g., custom headers, timeout override).
+            
+        Raises:
+            httpx.HTTPError: On API errors (e.g., 400, 401, 500).
+        """
+        response = await self._session.put(
+            '/webhook',
+            json={"endpoint": request.endpoint},
+            **(request_config or {})
+        )
         response.raise_for_status()
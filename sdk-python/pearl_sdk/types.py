@@ -1,9 +1,15 @@
 """Type definitions for the Pearl SDK."""
 
+import sys
 from typing import Dict, List, Optional, Union, Any
 from dataclasses import dataclass
 
 
+# Slotted dataclasses drop the per-instance __dict__, which shrinks every model and speeds up
+# attribute access. `slots=True` is only available on Python 3.10+.
+_DATACLASS_OPTIONS: Dict[str, Any] = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
 class ConversationModes:
     """Conversation mode constants for Pearl API."""
     # AI-only response mode
@@ -20,7 +26,7 @@ class ConversationModes:
 DEFAULT_MODEL = 'pearl-ai'
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class RetryPolicyConfig:
     """Configuration options for the retry policy."""
     enabled: Optional[bool] = None
@@ -29,27 +35,27 @@ class RetryPolicyConfig:
     max_retry_delay_ms: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class BaseRequest:
     """Base properties for request models with common fields."""
     model: str
     metadata: Dict[str, str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatMessage:
     """Represents a single message in a chat conversation."""
     role: str  # 'user', 'system', or 'assistant'
     content: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatCompletionRequest(BaseRequest):
     """Request payload for chat completions."""
     messages: List[ChatMessage]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ExpertInfo:
     """Represents information about the expert."""
     name: Optional[str]
@@ -57,7 +63,7 @@ class ExpertInfo:
     avatar_url: Optional[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatCompletionResponseMessage:
     """Represents a message from the assistant in a chat completion response."""
     is_human: bool
@@ -66,7 +72,7 @@ class ChatCompletionResponseMessage:
     content: Optional[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatCompletionChoice:
     """Represents a single choice (generated response) in a chat completion."""
     index: int
@@ -74,7 +80,7 @@ class ChatCompletionChoice:
     finish_reason: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ChatCompletionResponse:
     """Full response structure for chat completions and general completions."""
     id: str
@@ -84,7 +90,7 @@ class ChatCompletionResponse:
     user_id: Optional[str]
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProblemDetails:
     """Represents the detailed problem information."""
     message: str
@@ -94,13 +100,13 @@ class ProblemDetails:
     additional_properties: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ProblemDetailsResponse:
     """Represents the full error response from the API, wrapping a ProblemDetails object."""
     error: ProblemDetails
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WebhookPayload:
     """Represents the structure of a webhook payload from Pearl."""
     id: str
@@ -110,10 +116,7 @@ class WebhookPayload:
     expert: ExpertInfo
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class WebhookEndpointRequest:
     """Request payload for registering or updating a webhook endpoint."""
     endpoint: str
-
-
-
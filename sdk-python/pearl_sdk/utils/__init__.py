@@ -1,5 +1,17 @@
 """Pearl SDK for Python - Utils module."""
 
-from .signature_utils import compute_webhook_signature, verify_webhook_signature
+from .signature_utils import (
+    compute_webhook_signature,
+    verify_webhook_signature,
+    derive_webhook_hmac_key,
+    compute_webhook_signature_with_key,
+    verify_webhook_signature_with_key
+)
 
-__all__ = ['compute_webhook_signature', 'verify_webhook_signature']
+__all__ = [
+    'compute_webhook_signature',
+    'verify_webhook_signature',
+    'derive_webhook_hmac_key',
+    'compute_webhook_signature_with_key',
+    'verify_webhook_signature_with_key'
+]
@@ -3,35 +3,74 @@ Utilities for webhook signature computation and verification.
 """
 
 import base64
+import functools
 import hashlib
 import hmac
+from typing import Union
 
 
-def _derive_hmac_key(initial_secret: str) -> str:
+# Webhook bodies may be passed as the decoded JSON string or as the raw request bytes
+RawPayload = Union[str, bytes, bytearray, memoryview]
+
+# A 20-byte HMAC-SHA1 digest always Base64-encodes to 28 characters, including padding
+_SIGNATURE_LENGTH = 28
+
+# Module-level bindings for the functions on the signing and verification path, so each call
+# resolves a single global instead of a global plus a module attribute
+_hmac_new = hmac.new
+_compare_digest = hmac.compare_digest
+_sha1 = hashlib.sha1
+_b64encode = base64.b64encode
+
+
+@functools.lru_cache(maxsize=16)
+def _derive_hmac_key_bytes(initial_secret: str) -> bytes:
     """
-    Derives the actual HMAC key from the provided secret using SHA256 hashing and string concatenation.
+    Derives the actual HMAC key from the provided secret using SHA256 hashing and concatenation.
+    
+    The key is the uppercase hexadecimal form of the digest, which is what the Pearl API and the
+    other Pearl SDKs sign with. `base64.b16encode` produces those ASCII bytes in a single step.
+    Keys are cached per secret, so the secret-based helpers do not rehash it on every call.
     
     Args:
         initial_secret: The initial secret.
         
     Returns:
-        The SHA256-derived HMAC key as an uppercase hexadecimal string.
+        The SHA256-derived HMAC key as uppercase hexadecimal ASCII bytes.
     """
-    concatenated_string = f"{initial_secret}:reference_token"
-    hash_bytes = hashlib.sha256(concatenated_string.encode('utf-8')).digest()
-    return hash_bytes.hex().upper()
+    hash_bytes = hashlib.sha256(initial_secret.encode('utf-8') + b":reference_token").digest()
+    return base64.b16encode(hash_bytes)
 
 
-def compute_webhook_signature(secret: str, payload: str) -> str:
+def _payload_bytes(payload: RawPayload) -> Union[bytes, bytearray, memoryview]:
     """
-    Computes the HMAC-SHA1 signature for a given webhook payload and secret.
+    Returns the bytes to sign for a webhook payload, encoding strings as UTF-8.
+    
+    Binary payloads are returned unchanged, so raw request bodies are not decoded and re-encoded.
+    
+    Args:
+        payload: The raw webhook body, as a string or bytes-like object.
+        
+    Returns:
+        The payload as a bytes-like object.
+    """
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return payload
+    return payload.encode('utf-8')
+
+
+def derive_webhook_hmac_key(secret: str) -> bytes:
+    """
+    Derives the HMAC key used to sign webhooks from the webhook secret.
+    
+    The key only depends on the secret, so callers verifying many webhooks should derive it
+    once and pass it to `compute_webhook_signature_with_key`/`verify_webhook_signature_with_key`.
     
     Args:
         secret: The webhook secret (your `referenceToken`).
-        payload: The raw JSON string of the webhook body.
         
     Returns:
-        The Base64-encoded HMAC-SHA1 signature.
+        The derived HMAC key, as UTF-8 encoded bytes.
         
     Raises:
         ValueError: If the webhook secret is empty.
@@ -39,27 +78,142 @@ def compute_webhook_signature(secret: str, payload: str) -> str:
     if not secret:
         raise ValueError("Webhook secret cannot be empty.")
     
-    hmac_key = _derive_hmac_key(secret)
-    hmac_digest = hmac.new(
-        hmac_key.encode('utf-8'),
-        payload.encode('utf-8'),
-        hashlib.sha1
-    ).digest()
+    return _derive_hmac_key_bytes(secret)
+
+
+@functools.lru_cache(maxsize=16)
+def _keyed_hmac_template(hmac_key: bytes) -> "hmac.HMAC":
+    """
+    Returns an HMAC-SHA1 state already keyed with `hmac_key`, to be copied per payload.
+    
+    Keying pads the key and hashes the inner and outer blocks; for a typical webhook body that
+    is as much work as hashing the payload itself. Applications verify with one or a handful of
+    secrets, so a small cache lets the key-based helpers skip it for most calls.
+    
+    Args:
+        hmac_key: The HMAC key returned by `derive_webhook_hmac_key`.
+        
+    Returns:
+        A keyed HMAC object that must not be updated directly.
+    """
+    return _hmac_new(hmac_key, digestmod=_sha1)
+
+
+def _compute_webhook_digest(hmac_key: bytes, payload: RawPayload) -> bytes:
+    """
+    Computes the raw HMAC-SHA1 digest for a given webhook payload using an already derived HMAC key.
+    
+    Args:
+        hmac_key: The HMAC key returned by `derive_webhook_hmac_key`.
+        payload: The raw JSON body of the webhook, as a string or the raw request bytes.
+        
+    Returns:
+        The 20-byte HMAC-SHA1 digest.
+    """
+    # Mutable keys are converted, since the template cache needs a hashable key
+    if type(hmac_key) is not bytes:
+        hmac_key = bytes(hmac_key)
+    signer = _keyed_hmac_template(hmac_key).copy()
+    signer.update(_payload_bytes(payload))
+    return signer.digest()
+
+
+def compute_webhook_signature_with_key(hmac_key: bytes, payload: RawPayload) -> str:
+    """
+    Computes the HMAC-SHA1 signature for a given webhook payload using an already derived HMAC key.
     
-    return base64.b64encode(hmac_digest).decode('utf-8')
+    Args:
+        hmac_key: The HMAC key returned by `derive_webhook_hmac_key`.
+        payload: The raw JSON body of the webhook, as a string or the raw request bytes.
+        
+    Returns:
+        The Base64-encoded HMAC-SHA1 signature.
+    """
+    return _b64encode(_compute_webhook_digest(hmac_key, payload)).decode('utf-8')
+
+
+def verify_webhook_signature_with_key(
+    received_signature: Union[str, bytes],
+    webhook_payload_json_string: RawPayload,
+    hmac_key: bytes
+) -> bool:
+    """
+    Verifies a Pearl webhook signature using an already derived HMAC key.
+    
+    Args:
+        received_signature: The signature received in the 'X-Pearl-API-Signature' header, as a string or bytes.
+        webhook_payload_json_string: The raw JSON body of the webhook request, as a string or bytes.
+        hmac_key: The HMAC key returned by `derive_webhook_hmac_key`.
+        
+    Returns:
+        boolean indicating if the signature is valid.
+        
+    Raises:
+        ValueError: If required parameters are missing.
+    """
+    if not received_signature or not webhook_payload_json_string or not hmac_key:
+        raise ValueError("Missing required parameters for webhook signature verification.")
+
+    computed_digest = _compute_webhook_digest(hmac_key, webhook_payload_json_string)
+    return _signatures_match(received_signature, computed_digest)
+
+
+def _signatures_match(received_signature: Union[str, bytes], computed_digest: bytes) -> bool:
+    """
+    Compares a received signature against a computed digest in constant time.
+    
+    The comparison is done on the Base64 text: Base64 is a fixed, injective encoding of the
+    fixed-length digest, so comparing the encoded forms reveals no more than comparing the raw
+    bytes, and the received signature never has to be decoded. Signatures of the wrong length,
+    string signatures containing non-ASCII characters, and values that are neither `str` nor
+    bytes are rejected before any comparison.
+    
+    Args:
+        received_signature: The Base64-encoded signature received with the webhook, as a string
+            or the raw header bytes.
+        computed_digest: The raw HMAC-SHA1 digest computed for the payload.
+        
+    Returns:
+        boolean indicating if the signature is the Base64 encoding of the computed digest.
+    """
+    if isinstance(received_signature, str):
+        if len(received_signature) != _SIGNATURE_LENGTH or not received_signature.isascii():
+            return False
+        received_signature = received_signature.encode('ascii')
+    elif not isinstance(received_signature, (bytes, bytearray)) or len(received_signature) != _SIGNATURE_LENGTH:
+        return False
+    
+    return _compare_digest(received_signature, _b64encode(computed_digest))
+
+
+def compute_webhook_signature(secret: str, payload: RawPayload) -> str:
+    """
+    Computes the HMAC-SHA1 signature for a given webhook payload and secret.
+    
+    Args:
+        secret: The webhook secret (your `referenceToken`).
+        payload: The raw JSON body of the webhook, as a string or the raw request bytes.
+        
+    Returns:
+        The Base64-encoded HMAC-SHA1 signature.
+        
+    Raises:
+        ValueError: If the webhook secret is empty.
+    """
+    return compute_webhook_signature_with_key(derive_webhook_hmac_key(secret), payload)
 
 
 def verify_webhook_signature(
-    received_signature: str,
-    webhook_payload_json_string: str,
+    received_signature: Union[str, bytes],
+    webhook_payload_json_string: RawPayload,
     webhook_secret: str
 ) -> bool:
     """
     Verifies the authenticity of a Pearl webhook payload using its signature.
     
     Args:
-        received_signature: The signature received in the 'X-Pearl-API-Signature' header.
-        webhook_payload_json_string: The raw JSON string of the webhook request body.
+        received_signature: The signature received in the 'X-Pearl-API-Signature' header, as a string or bytes.
+        webhook_payload_json_string: The raw JSON body of the webhook request, as a string or bytes.
         webhook_secret: The shared secret.
         
     Returns:
@@ -71,15 +225,6 @@ def verify_webhook_signature(
     if not received_signature or not webhook_payload_json_string or not webhook_secret:
         raise ValueError("Missing required parameters for webhook signature verification.")
 
-    computed_signature = compute_webhook_signature(webhook_secret, webhook_payload_json_string)
-    
-    try:
-        received_sig_bytes = base64.b64decode(received_signature)
-        computed_sig_bytes = base64.b64decode(computed_signature)
-    except Exception:
-        return False
-    
-    if len(received_sig_bytes) != len(computed_sig_bytes):
-        return False
-    
-    return hmac.compare_digest(received_sig_bytes, computed_sig_bytes)
+    # Parameters were validated above, so skip the checks repeated by the public helpers
+    computed_digest = _compute_webhook_digest(_derive_hmac_key_bytes(webhook_secret), webhook_payload_json_string)
+    return _signatures_match(received_signature, computed_digest)
@@ -2,6 +2,7 @@
 
 import pytest
 from unittest.mock import Mock
+import httpx
 from pearl_sdk import PearlClient
 
 
@@ -23,12 +24,22 @@ def basic_client_config(mock_api_key):
     return {"api_key": mock_api_key}
 
 
+@pytest.fixture
+def proxy_environment(monkeypatch):
+    """Route HTTPS traffic through a test proxy, bypassing it for internal.test."""
+    for name in ('HTTP_PROXY', 'HTTPS_PROXY', 'ALL_PROXY', 'NO_PROXY'):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv('HTTPS_PROXY', 'http://proxy.test:8080')
+    monkeypatch.setenv('NO_PROXY', 'internal.test')
+    return 'http://proxy.test:8080'
+
+
 @pytest.fixture
 def mock_session():
-    """Provide a mock requests session."""
-    session = Mock()
-    session.post.return_value.json.return_value = {}
-    session.post.return_value.raise_for_status.return_value = None
-    session.put.return_value.raise_for_status.return_value = None
-    session.get.return_value.raise_for_status.return_value = None
+    """Provide a mock HTTP session restricted to the httpx.Client interface."""
+    session = Mock(spec_set=httpx.Client)
+    for method in (session.post, session.put, session.get):
+        method.return_value = Mock(spec_set=httpx.Response)
+        method.return_value.raise_for_status.return_value = None
     return session
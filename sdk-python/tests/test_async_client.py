@@ -0,0 +1,179 @@
+"""Tests for the AsyncPearlClient and its asynchronous resources."""
+
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+import httpcore
+import httpx
+from pearl_sdk import AsyncPearlClient, RetryPolicyConfig
+from pearl_sdk.async_client import AsyncRetryTransport
+from pearl_sdk.core.retry_policy import RetryPolicy
+from pearl_sdk.resources.chat import AsyncChat
+from pearl_sdk.resources.webhooks import AsyncWebhooks
+from pearl_sdk.types import ChatMessage, ChatCompletionResponse, WebhookEndpointRequest
+
+
+class TestAsyncPearlClient:
+    """Test cases for AsyncPearlClient."""
+
+    def test_constructor_raises_error_for_missing_api_key(self):
+        """Test constructor raises error if api_key is missing."""
+        with pytest.raises(ValueError, match="AsyncPearlClient must include an api_key"):
+            AsyncPearlClient(api_key="")
+
+    def test_constructor_configures_session(self, mock_api_key, mock_base_url):
+        """Test constructor configures the session and asynchronous resources."""
+        client = AsyncPearlClient(api_key=mock_api_key, base_url=mock_base_url)
+
+        assert isinstance(client._session, httpx.AsyncClient)
+        assert client._session.base_url == httpx.URL(mock_base_url + '/')
+        assert client._session.headers['Authorization'] == f'Bearer {mock_api_key}'
+        assert isinstance(client.chat, AsyncChat)
+        assert isinstance(client.webhooks, AsyncWebhooks)
+        asyncio.run(client.aclose())
+
+
+    def test_environment_proxies_are_honoured(self, mock_api_key, proxy_environment):
+        """Test HTTPS_PROXY and NO_PROXY apply even though the client uses a custom transport."""
+        client = AsyncPearlClient(api_key=mock_api_key)
+
+        proxied = client._session._transport_for_url(httpx.URL('https://api.pearl.com/api/v1/chat/completions'))
+        bypassed = client._session._transport_for_url(httpx.URL('https://internal.test/api'))
+
+        assert isinstance(proxied, AsyncRetryTransport)
+        assert isinstance(proxied.transport._pool, httpcore.AsyncHTTPProxy)
+        assert bypassed is client._session._transport
+        asyncio.run(client.aclose())
+
+class TestAsyncChat:
+    """Test cases for AsyncChat."""
+
+    def setup_method(self):
+        """Set up test fixtures before each test method."""
+        self.mock_session = Mock(spec=httpx.AsyncClient)
+        self.mock_session.post = AsyncMock()
+        self.chat = AsyncChat(self.mock_session)
+
+    def test_send_completion_success(self):
+        """Test successful asynchronous chat completion request."""
+        mock_response = Mock()
+        mock_response.content = json.dumps({
+            "id": "chatcmpl-test",
+            "choices": [{
+                "index": 0,
+                "message": {"isHuman": False, "role": "assistant", "content": "Async response."},
+                "finish_reason": "stop"
+            }],
+            "created": 1678886400
+        }).encode('utf-8')
+        self.mock_session.post.return_value = mock_response
+
+        result = asyncio.run(self.chat.send_completion(
+            [ChatMessage(role="user", content="Test message")],
+            "test-session-123",
+            "test-mode",
+            "test-model"
+        ))
+
+        self.mock_session.post.assert_awaited_once()
+        args, kwargs = self.mock_session.post.call_args
+        assert args == ('/chat/completions',)
+        assert json.loads(kwargs['content']) == {
+            "model": "test-model",
+            "messages": [{"role": "user", "content": "Test message"}],
+            "metadata": {"mode": "test-mode", "sessionId": "test-session-123"}
+        }
+        assert isinstance(result, ChatCompletionResponse)
+        assert result.choices[0].message.content == "Async response."
+
+    def test_send_completion_http_error(self):
+        """Test that HTTP errors are properly raised."""
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = httpx.HTTPError("API Error")
+        self.mock_session.post.return_value = mock_response
+
+        with pytest.raises(httpx.HTTPError, match="API Error"):
+            asyncio.run(self.chat.send_completion(
+                [ChatMessage(role="user", content="Test message")],
+                "test-session-123"
+            ))
+
+
+class TestAsyncWebhooks:
+    """Test cases for AsyncWebhooks."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.mock_session = Mock(spec=httpx.AsyncClient)
+        self.mock_session.post = AsyncMock(return_value=Mock())
+        self.mock_session.put = AsyncMock(return_value=Mock())
+        self.webhooks = AsyncWebhooks(self.mock_session, 'supersecretkey1234567890abcdef')
+
+    def test_register_awaits_session_post(self):
+        """Test register awaits session.post with the correct endpoint and request."""
+        asyncio.run(self.webhooks.register(WebhookEndpointRequest(endpoint='https://example.com/webhook')))
+
+        self.mock_session.post.assert_awaited_once_with(
+            '/webhook',
+            json={'endpoint': 'https://example.com/webhook'}
+        )
+
+    def test_update_awaits_session_put_with_request_config(self):
+        """Test update awaits session.put with request_config."""
+        asyncio.run(self.webhooks.update(
+            WebhookEndpointRequest(endpoint='https://example.com/updated-webhook'),
+            {'timeout': 5}
+        ))
+
+        self.mock_session.put.assert_awaited_once_with(
+            '/webhook',
+            json={'endpoint': 'https://example.com/updated-webhook'},
+            timeout=5
+        )
+
+
+class TestAsyncRetryTransport:
+    """Test cases for AsyncRetryTransport."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.status_codes = []
+        self.request = httpx.Request('POST', 'https://api.test.com/api/v1/chat/completions')
+
+    def _create_transport(self, status_codes, config=None):
+        """Create a retry transport replaying the given status codes."""
+        responses = iter(status_codes)
+
+        async def handler(request):
+            status_code = next(responses)
+            self.status_codes.append(status_code)
+            return httpx.Response(status_code)
+
+        return AsyncRetryTransport(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(config),
+            timeout=30
+        )
+
+    @patch('pearl_sdk.async_client.asyncio.sleep', new_callable=AsyncMock)
+    def test_retries_retryable_status_until_success(self, mock_sleep):
+        """Test a 422 response is retried until a successful response is received."""
+        transport = self._create_transport([422, 422, 200])
+
+        response = asyncio.run(transport.handle_async_request(self.request))
+
+        assert response.status_code == 200
+        assert self.status_codes == [422, 422, 200]
+        assert mock_sleep.await_count == 2
+
+    @patch('pearl_sdk.async_client.asyncio.sleep', new_callable=AsyncMock)
+    def test_stops_after_max_retries(self, mock_sleep):
+        """Test the last response is returned once max_retries is exhausted."""
+        transport = self._create_transport([422] * 2, RetryPolicyConfig(max_retries=1))
+
+        response = asyncio.run(transport.handle_async_request(self.request))
+
+        assert response.status_code == 422
+        assert len(self.status_codes) == 2
+        assert mock_sleep.await_count == 1
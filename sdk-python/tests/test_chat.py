@@ -1,9 +1,11 @@
 """Tests for the Chat resource."""
 
+import json
+import sys
 import pytest
 from unittest.mock import Mock, patch
-import requests
-from pearl_sdk.resources.chat import Chat
+import httpx
+from pearl_sdk.resources.chat import Chat, _request_envelope
 from pearl_sdk.types import (
     ChatMessage, ChatCompletionResponse,
     ChatCompletionChoice, ChatCompletionResponseMessage
@@ -15,7 +17,7 @@ class TestChat:
 
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.mock_session = Mock(spec=requests.Session)
+        self.mock_session = Mock(spec_set=httpx.Client)
         self.chat = Chat(self.mock_session)
 
     def test_constructor_initializes_with_session(self):
@@ -56,7 +58,7 @@ class TestChat:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode('utf-8')
         mock_response.raise_for_status.return_value = None
         self.mock_session.post.return_value = mock_response
 
@@ -64,14 +66,15 @@ class TestChat:
         result = self.chat.send_completion(test_messages, test_session_id, test_mode, test_model)
 
         # Assert
-        self.mock_session.post.assert_called_once_with(
-            '/chat/completions',
-            json={
-                "model": "test-model",
-                "messages": [{"role": "user", "content": "Test message"}],
-                "metadata": {"mode": "test-mode", "sessionId": "test-session-123"}
-            }
-        )
+        self.mock_session.post.assert_called_once()
+        args, kwargs = self.mock_session.post.call_args
+        assert args == ('/chat/completions',)
+        assert kwargs.keys() == {'content'}
+        assert json.loads(kwargs['content']) == {
+            "model": "test-model",
+            "messages": [{"role": "user", "content": "Test message"}],
+            "metadata": {"mode": "test-mode", "sessionId": "test-session-123"}
+        }
         
         assert isinstance(result, ChatCompletionResponse)
         assert result.id == "chatcmpl-test"
@@ -98,7 +101,7 @@ class TestChat:
         }
 
         mock_response = Mock()
-        mock_response.json.return_value = mock_response_data
+        mock_response.content = json.dumps(mock_response_data).encode('utf-8')
         mock_response.raise_for_status.return_value = None
         self.mock_session.post.return_value = mock_response
 
@@ -106,16 +109,31 @@ class TestChat:
         result = self.chat.send_completion(test_messages, test_session_id, mode="PEARL_AI", model=test_model, request_config=request_config)
 
         # Assert
-        self.mock_session.post.assert_called_once_with(
-            '/chat/completions',
-            json={
-                "model": "test-model",
-                "messages": [{"role": "user", "content": "Test message"}],
-                "metadata": {"mode": "PEARL_AI", "sessionId": "test-session-123"}
-            },
-            headers={"X-Custom-Header": "test-value"},
-            timeout=30
-        )
+        self.mock_session.post.assert_called_once()
+        args, kwargs = self.mock_session.post.call_args
+        assert args == ('/chat/completions',)
+        assert json.loads(kwargs.pop('content')) == {
+            "model": "test-model",
+            "messages": [{"role": "user", "content": "Test message"}],
+            "metadata": {"mode": "PEARL_AI", "sessionId": "test-session-123"}
+        }
+        assert kwargs == {"headers": {"X-Custom-Header": "test-value"}, "timeout": 30}
+
+    def test_build_request_body_reuses_cached_envelope(self):
+        """Test the request envelope is cached per session and escapes its values."""
+        messages = [ChatMessage(role="user", content='Say "hi"')]
+        session_id = 'session-"quoted"-\u00e9'
+        
+        self.chat._build_request_body(messages, session_id, "test-mode", "test-model")
+        hits_before = _request_envelope.cache_info().hits
+        body = self.chat._build_request_body(messages, session_id, "test-mode", "test-model")
+        
+        assert _request_envelope.cache_info().hits == hits_before + 1
+        assert json.loads(body) == {
+            "model": "test-model",
+            "metadata": {"mode": "test-mode", "sessionId": session_id},
+            "messages": [{"role": "user", "content": 'Say "hi"'}]
+        }
 
     def test_send_completion_http_error(self):
         """Test that HTTP errors are properly raised."""
@@ -125,11 +143,11 @@ class TestChat:
         test_model = "test-model"
         
         mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.RequestException("API Error")
+        mock_response.raise_for_status.side_effect = httpx.HTTPError("API Error")
         self.mock_session.post.return_value = mock_response
 
         # Act & Assert
-        with pytest.raises(requests.RequestException, match="API Error"):
+        with pytest.raises(httpx.HTTPError, match="API Error"):
             self.chat.send_completion(test_messages, test_session_id, model=test_model)
 
     def test_parse_chat_completion_response_with_expert_info(self):
@@ -187,3 +205,25 @@ class TestChat:
         
         assert result.question_id == "q123"
         assert result.user_id == "u456"
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="slotted dataclasses require Python 3.10+")
+    def test_parsed_response_objects_are_slotted(self):
+        """Test parsed response models carry no per-instance __dict__."""
+        result = self.chat._parse_chat_completion_response({
+            "id": "chatcmpl-test",
+            "choices": [{
+                "index": 0,
+                "message": {
+                    "isHuman": True,
+                    "expertInfo": {"name": "Dr. Smith"},
+                    "role": "assistant",
+                    "content": "Expert response."
+                },
+                "finish_reason": "stop"
+            }],
+            "created": 1678886400
+        })
+
+        choice = result.choices[0]
+        for model in (result, choice, choice.message, choice.message.expert_info):
+            assert not hasattr(model, '__dict__')
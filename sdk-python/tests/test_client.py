@@ -0,0 +1,229 @@
+"""Tests for the PearlClient and its retry transport."""
+
+import inspect
+import os
+import socket
+import pytest
+from unittest.mock import Mock, patch
+import httpcore
+import httpx
+from pearl_sdk import PearlClient, RetryPolicyConfig
+from pearl_sdk import client as client_module
+from pearl_sdk.client import RetryTransport, _SOCKET_OPTIONS, _get_default_pool
+from pearl_sdk.core.retry_policy import RetryPolicy
+from pearl_sdk.resources.chat import Chat
+from pearl_sdk.resources.webhooks import Webhooks
+
+
+class TestPearlClient:
+    """Test cases for PearlClient."""
+
+    def test_constructor_raises_error_for_missing_api_key(self):
+        """Test constructor raises error if api_key is missing."""
+        with pytest.raises(ValueError, match="PearlClient must include an api_key"):
+            PearlClient(api_key="")
+
+    def test_constructor_raises_error_for_invalid_timeout(self):
+        """Test constructor raises error if timeout is not a positive number."""
+        with pytest.raises(ValueError, match="Timeout must be a positive number"):
+            PearlClient(api_key="test_api_key_123", timeout=0)
+
+    def test_constructor_configures_session(self, mock_api_key, mock_base_url):
+        """Test constructor configures the session with base URL, headers and timeout."""
+        client = PearlClient(api_key=mock_api_key, base_url=mock_base_url, timeout=10)
+
+        assert client._session.base_url == httpx.URL(mock_base_url + '/')
+        assert client._session.headers['Authorization'] == f'Bearer {mock_api_key}'
+        assert client._session.headers['Content-Type'] == 'application/json'
+        assert client._session.timeout == httpx.Timeout(10)
+        assert isinstance(client.chat, Chat)
+        assert isinstance(client.webhooks, Webhooks)
+        client.close()
+
+    def test_resources_are_created_lazily(self, mock_api_key):
+        """Test resources are only created on first access and then reused."""
+        client = PearlClient(api_key=mock_api_key)
+
+        assert 'chat' not in vars(client)
+        assert 'webhooks' not in vars(client)
+
+        chat = client.chat
+
+        assert client.chat is chat
+        assert 'webhooks' not in vars(client)
+        with pytest.raises(AttributeError):
+            client.unknown_resource
+        client.close()
+
+    def test_relative_urls_are_resolved_against_base_url(self, mock_api_key, mock_base_url):
+        """Test resource paths are joined onto the configured base URL."""
+        client = PearlClient(api_key=mock_api_key, base_url=mock_base_url)
+
+        request = client._session.build_request('POST', '/chat/completions')
+
+        assert client.base_url == mock_base_url
+
+        assert str(request.url) == 'https://api.test.com/api/v1/chat/completions'
+        client.close()
+
+    def test_clients_share_default_connection_pool(self, mock_api_key):
+        """Test clients reuse one connection pool and closing a client leaves it open."""
+        first_client = PearlClient(api_key=mock_api_key)
+        second_client = PearlClient(api_key="another_api_key", timeout=5)
+        pool = _get_default_pool()
+
+        assert first_client._session._transport.transport is pool
+        assert second_client._session._transport.transport is pool
+
+        with patch.object(pool, 'close') as mock_close:
+            first_client.close()
+            second_client.close()
+
+        mock_close.assert_not_called()
+
+    @pytest.mark.skipif(not hasattr(os, 'fork'), reason="requires os.fork")
+    def test_forked_child_does_not_reuse_parent_pool(self, mock_api_key):
+        """Test a forked child builds its own connection pool instead of reusing the parent's."""
+        parent_pool = _get_default_pool()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the child process
+            status = 1
+            try:
+                untouched = client_module._default_pool is None
+                child_client = PearlClient(api_key=mock_api_key)
+                fresh = child_client._session._transport.transport is not parent_pool
+                status = 0 if untouched and fresh else 1
+            finally:
+                os.write(write_fd, bytes([status]))
+                os._exit(0)
+        os.close(write_fd)
+        try:
+            result = os.read(read_fd, 1)
+        finally:
+            os.close(read_fd)
+            os.waitpid(pid, 0)
+
+        assert result == b'\x00'
+        assert _get_default_pool() is parent_pool
+
+    def test_installed_httpx_supports_socket_options(self):
+        """Test the installed httpx meets the declared floor (0.25.0) that added `socket_options`."""
+        for transport_class in (httpx.HTTPTransport, httpx.AsyncHTTPTransport):
+            assert 'socket_options' in inspect.signature(transport_class.__init__).parameters
+
+    def test_environment_proxies_are_honoured(self, mock_api_key, proxy_environment):
+        """Test HTTPS_PROXY and NO_PROXY apply even though the client uses a custom transport."""
+        client = PearlClient(api_key=mock_api_key)
+
+        proxied = client._session._transport_for_url(httpx.URL('https://api.pearl.com/api/v1/chat/completions'))
+        bypassed = client._session._transport_for_url(httpx.URL('https://internal.test/api'))
+
+        assert isinstance(proxied, RetryTransport)
+        assert proxied.transport is _get_default_pool(proxy_environment)
+        assert isinstance(proxied.transport._pool, httpcore.HTTPProxy)
+        assert bypassed.transport is _get_default_pool()
+        client.close()
+
+    def test_socket_options_enable_tcp_keepalive(self):
+        """Test pooled sockets are configured with TCP keep-alive enabled."""
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in _SOCKET_OPTIONS
+
+
+class TestRetryTransport:
+    """Test cases for RetryTransport."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.status_codes = []
+        self.request = httpx.Request('POST', 'https://api.test.com/api/v1/chat/completions')
+
+    def _create_transport(self, status_codes, config=None):
+        """Create a retry transport replaying the given status codes."""
+        responses = iter(status_codes)
+
+        def handler(request):
+            status_code = next(responses)
+            self.status_codes.append(status_code)
+            return httpx.Response(status_code)
+
+        return RetryTransport(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(config),
+            timeout=30
+        )
+
+    @patch('pearl_sdk.client.time.sleep')
+    def test_retries_retryable_status_until_success(self, mock_sleep):
+        """Test a 422 response is retried until a successful response is received."""
+        transport = self._create_transport([422, 422, 200])
+
+        response = transport.handle_request(self.request)
+
+        assert response.status_code == 200
+        assert self.status_codes == [422, 422, 200]
+        assert mock_sleep.call_count == 2
+
+    @patch('pearl_sdk.client.time.sleep')
+    def test_does_not_retry_non_retryable_status(self, mock_sleep):
+        """Test non-retryable responses are returned immediately."""
+        transport = self._create_transport([500])
+
+        response = transport.handle_request(self.request)
+
+        assert response.status_code == 500
+        assert self.status_codes == [500]
+        mock_sleep.assert_not_called()
+
+    @patch('pearl_sdk.client.time.sleep')
+    def test_stops_after_max_retries(self, mock_sleep):
+        """Test the last response is returned once max_retries is exhausted."""
+        transport = self._create_transport([422] * 3, RetryPolicyConfig(max_retries=2))
+
+        response = transport.handle_request(self.request)
+
+        assert response.status_code == 422
+        assert len(self.status_codes) == 3
+        assert mock_sleep.call_count == 2
+
+    @patch('pearl_sdk.client.time.sleep')
+    @patch('pearl_sdk.client.time.monotonic')
+    def test_stops_retrying_once_deadline_is_exhausted(self, mock_monotonic, mock_sleep):
+        """Test retries stop and the last response is returned once the time budget is spent."""
+        # Deadline is 0 + 30 * (2 + 1) = 90 seconds
+        mock_monotonic.side_effect = [0, 89.95, 90]
+        transport = self._create_transport([422] * 3, RetryPolicyConfig(max_retries=2))
+
+        response = transport.handle_request(self.request)
+
+        assert response.status_code == 422
+        assert self.status_codes == [422, 422]
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args.args[0] == pytest.approx(0.05)
+
+    def test_close_only_closes_owned_transport(self):
+        """Test close leaves a shared underlying transport open."""
+        transport = self._create_transport([])
+        transport.transport = Mock(spec=httpx.BaseTransport)
+
+        transport.owns_transport = False
+        transport.close()
+        transport.transport.close.assert_not_called()
+
+        transport.owns_transport = True
+        transport.close()
+        transport.transport.close.assert_called_once()
+
+    def test_propagates_transport_errors(self):
+        """Test network errors are raised without retrying."""
+        def handler(request):
+            raise httpx.ConnectError("Connection failed")
+
+        transport = RetryTransport(
+            transport=httpx.MockTransport(handler),
+            retry_policy=RetryPolicy(),
+            timeout=30
+        )
+
+        with pytest.raises(httpx.ConnectError, match="Connection failed"):
+            transport.handle_request(self.request)
@@ -63,6 +63,11 @@ class TestRetryPolicy:
         policy = RetryPolicy(RetryPolicyConfig(max_retries=10))
         assert policy.max_retries == 10
 
+    def test_retryable_status_codes_getter(self):
+        """Test the retryable_status_codes getter for enabled and disabled policies."""
+        assert RetryPolicy().retryable_status_codes == frozenset({422})
+        assert RetryPolicy(RetryPolicyConfig(enabled=False)).retryable_status_codes == frozenset()
+
     def test_should_retry_disabled_policy(self):
         """Test should_retry returns False if retry policy is disabled."""
         disabled_policy = RetryPolicy(RetryPolicyConfig(enabled=False))
@@ -112,6 +117,15 @@ class TestRetryPolicy:
         delay = policy.calculate_retry_delay(10)  # Would be 100 * 2^9 = 51200 without cap
         assert delay <= 550  # 500 + 10% jitter
 
+    def test_calculate_retry_delay_caps_high_retry_counts(self):
+        """Test that very high retry counts are capped without overflowing."""
+        policy = RetryPolicy(RetryPolicyConfig(max_retries=50, retry_delay_ms=100, max_retry_delay_ms=60000))
+        
+        for retry_count in (17, 50, 1000):
+            delay = policy.calculate_retry_delay(retry_count)
+            assert isinstance(delay, int)
+            assert 60000 <= delay <= 66000  # 60000 + 10% jitter
+
     def test_calculate_retry_delay_includes_jitter(self):
         """Test that jitter is applied to delay calculation."""
         policy = RetryPolicy(RetryPolicyConfig(retry_delay_ms=100, max_retry_delay_ms=10000))
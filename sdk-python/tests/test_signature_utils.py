@@ -1,7 +1,14 @@
 """Tests for signature utilities."""
 
+import base64
+import hashlib
+import hmac
 import pytest
-from pearl_sdk.utils.signature_utils import compute_webhook_signature, verify_webhook_signature
+from unittest.mock import patch
+from pearl_sdk.utils.signature_utils import (
+    compute_webhook_signature, verify_webhook_signature, derive_webhook_hmac_key,
+    compute_webhook_signature_with_key, verify_webhook_signature_with_key, _keyed_hmac_template
+)
 
 
 class TestSignatureUtils:
@@ -25,12 +32,60 @@ class TestSignatureUtils:
         is_valid = verify_webhook_signature(computed_signature, self.test_payload, self.test_secret)
         assert is_valid is True
 
+    def test_verify_webhook_signature_uses_constant_time_comparison(self):
+        """Test that verify_webhook_signature compares signatures with hmac.compare_digest."""
+        computed_signature = compute_webhook_signature(self.test_secret, self.test_payload)
+        with patch('pearl_sdk.utils.signature_utils._compare_digest', wraps=hmac.compare_digest) as mock_compare:
+            is_valid = verify_webhook_signature(computed_signature, self.test_payload, self.test_secret)
+        assert is_valid is True
+        mock_compare.assert_called_once()
+        assert all(isinstance(arg, bytes) for arg in mock_compare.call_args.args)
+
+    def test_verify_webhook_signature_accepts_bytes_signature(self):
+        """Test that a signature passed as raw header bytes is verified like its string form."""
+        computed_signature = compute_webhook_signature(self.test_secret, self.test_payload)
+        signature_bytes = computed_signature.encode('ascii')
+        assert verify_webhook_signature(signature_bytes, self.test_payload, self.test_secret) is True
+        assert verify_webhook_signature(b'A' * 28, self.test_payload, self.test_secret) is False
+        assert verify_webhook_signature(b'\xff' * 28, self.test_payload, self.test_secret) is False
+
+    def test_verify_webhook_signature_returns_false_for_non_text_signature(self):
+        """Test that signatures that are neither str nor bytes are rejected instead of raising."""
+        for signature in (12345, ['A' * 28]):
+            assert verify_webhook_signature(signature, self.test_payload, self.test_secret) is False
+
+    def test_derived_key_is_uppercase_hex_of_sha256(self):
+        """Test that the derived key keeps the uppercase hex format shared with the other Pearl SDKs."""
+        digest = hashlib.sha256(f"{self.test_secret}:reference_token".encode('utf-8')).digest()
+        assert derive_webhook_hmac_key(self.test_secret) == digest.hex().upper().encode('utf-8')
+        assert derive_webhook_hmac_key(self.test_secret) is derive_webhook_hmac_key(self.test_secret)
+
+    def test_bytes_payloads_match_string_payloads(self):
+        """Test that bytes-like payloads are signed exactly like their UTF-8 string form."""
+        expected_signature = compute_webhook_signature(self.test_secret, self.test_payload)
+        payload_bytes = self.test_payload.encode('utf-8')
+        for payload in (payload_bytes, bytearray(payload_bytes), memoryview(payload_bytes)):
+            assert compute_webhook_signature(self.test_secret, payload) == expected_signature
+            assert verify_webhook_signature(expected_signature, payload, self.test_secret) is True
+
     def test_verify_webhook_signature_returns_false_for_invalid_signature(self):
         """Test that verify_webhook_signature returns False for an invalid signature."""
         invalid_signature = 'invalid-signature-12345='
         is_valid = verify_webhook_signature(invalid_signature, self.test_payload, self.test_secret)
         assert is_valid is False
 
+    def test_verify_webhook_signature_returns_false_for_undecodable_signature(self):
+        """Test that verify_webhook_signature returns False for signatures that are not valid Base64."""
+        for signature in ('abc', 'sïgnature', 'ï' * 28):
+            assert verify_webhook_signature(signature, self.test_payload, self.test_secret) is False
+
+    def test_verify_webhook_signature_rejects_wrong_length(self):
+        """Test that signatures that are not 28 characters long are rejected."""
+        computed_signature = compute_webhook_signature(self.test_secret, self.test_payload)
+        assert verify_webhook_signature(computed_signature + 'AAAA', self.test_payload, self.test_secret) is False
+        assert verify_webhook_signature(computed_signature[:-4], self.test_payload, self.test_secret) is False
+        assert verify_webhook_signature(computed_signature.encode('ascii') + b'=', self.test_payload, self.test_secret) is False
+
     def test_verify_webhook_signature_returns_false_for_tampered_payload(self):
         """Test that verify_webhook_signature returns False for a tampered payload."""
         computed_signature = compute_webhook_signature(self.test_secret, self.test_payload)
@@ -85,3 +140,29 @@ class TestSignatureUtils:
         signature2 = compute_webhook_signature(self.test_secret, payload2)
         
         assert signature1 != signature2
+
+    def test_keyed_functions_match_secret_based_functions(self):
+        """Test the keyed variants produce and accept the same signatures as the secret-based ones."""
+        hmac_key = derive_webhook_hmac_key(self.test_secret)
+        signature = compute_webhook_signature_with_key(hmac_key, self.test_payload)
+        
+        assert signature == compute_webhook_signature(self.test_secret, self.test_payload)
+        assert verify_webhook_signature_with_key(signature, self.test_payload, hmac_key) is True
+        assert verify_webhook_signature_with_key(signature, '{"tampered":true}', hmac_key) is False
+
+    def test_keyed_functions_reuse_cached_hmac_state(self):
+        """Test the keyed HMAC state is cached per key and never updated by signing."""
+        hmac_key = derive_webhook_hmac_key(self.test_secret)
+        expected_signature = base64.b64encode(
+            hmac.new(hmac_key, self.test_payload.encode('utf-8'), hashlib.sha1).digest()
+        ).decode('utf-8')
+        
+        assert compute_webhook_signature_with_key(hmac_key, self.test_payload) == expected_signature
+        assert compute_webhook_signature_with_key(bytearray(hmac_key), self.test_payload) == expected_signature
+        assert _keyed_hmac_template(hmac_key) is _keyed_hmac_template(hmac_key)
+        assert _keyed_hmac_template(hmac_key).digest() == hmac.new(hmac_key, digestmod=hashlib.sha1).digest()
+
+    def test_derive_webhook_hmac_key_raises_error_for_empty_secret(self):
+        """Test that derive_webhook_hmac_key raises ValueError if secret is empty."""
+        with pytest.raises(ValueError, match="Webhook secret cannot be empty"):
+            derive_webhook_hmac_key('')
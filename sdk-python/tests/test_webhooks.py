@@ -2,8 +2,10 @@
 
 import pytest
 from unittest.mock import Mock, patch
+import httpx
 from pearl_sdk.resources.webhooks import Webhooks
 from pearl_sdk.types import WebhookEndpointRequest
+from pearl_sdk.utils.signature_utils import compute_webhook_signature, _keyed_hmac_template
 
 
 class TestWebhooks:
@@ -12,7 +14,7 @@ class TestWebhooks:
     def setup_method(self):
         """Set up test fixtures."""
         self.mock_webhook_secret = 'supersecretkey1234567890abcdef'
-        self.mock_session = Mock()
+        self.mock_session = Mock(spec_set=httpx.Client)
         self.webhooks = Webhooks(self.mock_session, self.mock_webhook_secret)
 
     def test_constructor_initializes_correctly(self):
@@ -28,51 +30,105 @@ class TestWebhooks:
         with pytest.raises(ValueError, match="Webhook secret must be provided"):
             Webhooks(self.mock_session, None)
 
-    @patch('pearl_sdk.resources.webhooks.verify_webhook_signature')
-    def test_is_valid_signature_returns_true_for_valid_signature(self, mock_verify):
-        """Test is_valid_signature returns True when verification succeeds."""
-        mock_verify.return_value = True
-        
-        received_signature = 'mocked_signature'
+    def test_is_valid_signature_returns_true_for_valid_signature(self):
+        """Test is_valid_signature returns True for a signature computed with the same secret."""
         webhook_payload_json_string = '{"event":"test"}'
+        received_signature = compute_webhook_signature(self.mock_webhook_secret, webhook_payload_json_string)
         
         result = self.webhooks.is_valid_signature(received_signature, webhook_payload_json_string)
         
         assert result is True
-        mock_verify.assert_called_once_with(
-            received_signature, 
-            webhook_payload_json_string, 
-            self.mock_webhook_secret
-        )
 
-    @patch('pearl_sdk.resources.webhooks.verify_webhook_signature')
-    def test_is_valid_signature_returns_false_for_invalid_signature(self, mock_verify):
-        """Test is_valid_signature returns False when verification fails."""
-        mock_verify.return_value = False
+    def test_is_valid_signature_returns_false_for_invalid_signature(self):
+        """Test is_valid_signature returns False for a signature that does not match the payload."""
+        webhook_payload_json_string = '{"event":"test"}'
+        received_signature = compute_webhook_signature(self.mock_webhook_secret, '{"event":"other"}')
         
-        received_signature = 'mocked_signature'
+        assert self.webhooks.is_valid_signature(received_signature, webhook_payload_json_string) is False
+        assert self.webhooks.is_valid_signature('mocked_signature', webhook_payload_json_string) is False
+
+    def test_is_valid_signature_accepts_bytes_payload(self):
+        """Test is_valid_signature verifies the raw request bytes without decoding them first."""
         webhook_payload_json_string = '{"event":"test"}'
+        received_signature = self.webhooks.compute_signature(webhook_payload_json_string)
         
-        result = self.webhooks.is_valid_signature(received_signature, webhook_payload_json_string)
+        assert self.webhooks.is_valid_signature(received_signature, webhook_payload_json_string.encode('utf-8')) is True
+        assert self.webhooks.compute_signature(webhook_payload_json_string.encode('utf-8')) == received_signature
+
+    def test_is_valid_signature_raises_error_for_missing_parameters(self):
+        """Test is_valid_signature raises ValueError if required parameters are missing."""
+        with pytest.raises(ValueError, match="Missing required parameters"):
+            self.webhooks.is_valid_signature('', '{"event":"test"}')
         
-        assert result is False
-        mock_verify.assert_called_once_with(
-            received_signature, 
-            webhook_payload_json_string, 
-            self.mock_webhook_secret
-        )
+        with pytest.raises(ValueError, match="Missing required parameters"):
+            self.webhooks.is_valid_signature('any-sig', '')
+
+    def test_verify_many_yields_result_per_item(self):
+        """Test verify_many reports each signature/payload pair in order, including malformed ones."""
+        payload = '{"event":"test"}'
+        signature = self.webhooks.compute_signature(payload)
+        items = [
+            (signature, payload),
+            (signature, payload.encode('utf-8')),
+            (signature, '{"event":"tampered"}'),
+            ('', payload),
+            (signature, b''),
+        ]
+        
+        results = list(self.webhooks.verify_many(items))
+        
+        assert results == [
+            (signature, payload, True),
+            (signature, payload.encode('utf-8'), True),
+            (signature, '{"event":"tampered"}', False),
+            ('', payload, False),
+            (signature, b'', False),
+        ]
 
-    @patch('pearl_sdk.resources.webhooks.compute_webhook_signature')
-    def test_compute_signature_calls_utility_function(self, mock_compute):
-        """Test compute_signature calls the utility function with correct parameters."""
+    def test_verify_many_reports_non_text_signatures_as_invalid(self):
+        """Test verify_many accepts bytes signatures and reports other types as invalid without raising."""
+        payload = '{"event":"test"}'
+        signature = self.webhooks.compute_signature(payload)
+        
+        results = list(self.webhooks.verify_many([
+            (signature.encode('ascii'), payload),
+            (12345, payload),
+            (signature, payload),
+        ]))
+        
+        assert [is_valid for _, _, is_valid in results] == [True, False, True]
+
+    def test_signatures_reuse_keyed_hmac_state(self):
+        """Test signing goes through the shared keyed HMAC state instead of re-keying per payload."""
         payload = '{"data":"some_data"}'
-        computed_signature = 'mocked_computed_signature'
-        mock_compute.return_value = computed_signature
         
-        result = self.webhooks.compute_signature(payload)
+        with patch(
+            'pearl_sdk.utils.signature_utils._keyed_hmac_template',
+            wraps=_keyed_hmac_template
+        ) as mock_template:
+            signature = self.webhooks.compute_signature(payload)
+            assert self.webhooks.is_valid_signature(signature, payload) is True
+        
+        assert mock_template.call_count == 2
+        assert all(call.args == (self.webhooks._hmac_key,) for call in mock_template.call_args_list)
+
+    def test_compute_signature_matches_utility_function(self):
+        """Test compute_signature produces the same signature as the standalone utility."""
+        payload = '{"data":"some_data"}'
+        
+        assert self.webhooks.compute_signature(payload) == compute_webhook_signature(self.mock_webhook_secret, payload)
+        assert self.webhooks.is_valid_signature(self.webhooks.compute_signature(payload), payload) is True
+
+    @patch('pearl_sdk.resources.webhooks.derive_webhook_hmac_key', return_value=b'DERIVEDKEY')
+    def test_hmac_key_is_derived_once(self, mock_derive):
+        """Test the HMAC key is derived at construction and reused for every signature."""
+        webhooks = Webhooks(self.mock_session, self.mock_webhook_secret)
+        
+        webhooks.compute_signature('{"data":"first"}')
+        webhooks.compute_signature('{"data":"second"}')
         
-        assert result == computed_signature
-        mock_compute.assert_called_once_with(self.mock_webhook_secret, payload)
+        mock_derive.assert_called_once_with(self.mock_webhook_secret)
+        assert webhooks._hmac_key == b'DERIVEDKEY'
 
     def test_register_calls_session_post_with_correct_parameters(self):
         """Test register method calls session.post with correct endpoint and request."""